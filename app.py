@@ -2,9 +2,11 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 import joblib
-import plotly.express as px
+import plotly.graph_objects as go
 import os
 import io
+import threading
+import warnings
 
 # --- 1. CONFIGURATION AND INITIAL SETUP ---
 MODEL_PATH = 'models/pdm_rf_model.pkl'
@@ -16,6 +18,24 @@ COST_HIGH_RISK_REPAIR = 1500  # Major repair cost
 # Thresholds for classification
 RISK_THRESHOLD = 37  # Weekly score below which is considered high risk
 
+# Rows per predict_proba call; bounds the per-call working set on large uploads
+PREDICT_CHUNK_ROWS = 100_000
+
+# Frames at least this large aggregate with pandas' numba groupby engine (if installed)
+NUMBA_AGG_MIN_ROWS = 100_000
+NUMBA_ENGINE_KWARGS = {'nopython': True, 'parallel': True, 'nogil': True}
+# weekly_score dtypes the CSV reader infers; kernels are precompiled for each at startup
+NUMBA_WARM_DTYPES = ('int64', 'float64')
+
+# Frames larger than this aggregate with Polars' multi-threaded group_by (if installed)
+POLARS_AGG_MIN_ROWS = 200_000
+
+# Rows rendered per page of the analyzed data table
+TABLE_PAGE_ROWS = 5000
+
+# Risk level labels, ordered by predicted class (0 = low, 1 = high)
+RISK_LEVEL_CATEGORIES = ['Low Compliance Risk', 'HIGH RISK (Action Needed)']
+
 # --- 2. MODEL LOADING AND ANALYSIS FUNCTIONS ---
 
 @st.cache_resource
@@ -31,7 +51,44 @@ def load_model_assets():
         st.error(f"Error loading model assets: {e}")
         st.stop()
 
-# NOTE: @st.cache_data removed to resolve non-hashable argument error
+def read_uploaded_csv(uploaded_file, features):
+    """Reads only the columns the analysis needs, using the multi-threaded pyarrow reader."""
+    wanted = set(features) | {'record_date', 'unit_id', 'weekly_score'}
+
+    # Peek at the header so absent columns are still reported by analyze_data
+    header = pd.read_csv(uploaded_file, nrows=0).columns
+    uploaded_file.seek(0)
+    # Kept in file order: the pyarrow engine returns columns in usecols order
+    usecols = [c for c in header if c in wanted]
+    # Feature dtypes are left to inference so analyze_data can report non-numeric values itself
+    dtype = {
+        c: t for c, t in {'unit_id': str, 'weekly_score': 'float32'}.items()
+        if c in usecols and c not in features
+    }
+
+    return pd.read_csv(uploaded_file, engine='pyarrow', usecols=usecols, dtype=dtype)
+
+def parse_record_dates(dates):
+    """Parses record dates with the vectorized ISO-8601 parser (epoch seconds if numeric)."""
+    if pd.api.types.is_datetime64_any_dtype(dates):
+        return dates
+    if pd.api.types.is_numeric_dtype(dates):
+        return pd.to_datetime(dates, errors='coerce', unit='s', cache=True)
+    return pd.to_datetime(dates, errors='coerce', format='ISO8601', cache=True)
+
+def predict_proba_chunked(model, X):
+    """Runs predict_proba over fixed-size row chunks into one preallocated output array."""
+    proba = np.empty((len(X), len(model.classes_)), dtype=np.float32)
+
+    # Chunks run sequentially; parallelism comes from the forest's own n_jobs (model_training.py).
+    # The model was fitted on a DataFrame, so silence sklearn's per-call feature-name warning for ndarray input.
+    with warnings.catch_warnings():
+        warnings.filterwarnings('ignore', message='X does not have valid feature names', category=UserWarning)
+        for start in range(0, len(X), PREDICT_CHUNK_ROWS):
+            stop = start + PREDICT_CHUNK_ROWS
+            proba[start:stop] = model.predict_proba(X[start:stop])
+    return proba
+
 def analyze_data(df, model_assets):
     """
     Analyzes the DataFrame, makes predictions, calculates cost, and structures data.
@@ -40,113 +97,262 @@ def analyze_data(df, model_assets):
     features = model_assets['features']
     
     # Check if required features exist
-    missing_features = [f for f in features if f not in df.columns]
+    cols_set = set(df.columns)
+    missing_features = [f for f in features if f not in cols_set]
     if missing_features:
         st.error(f"Error: Uploaded CSV is missing required features: {', '.join(missing_features)}. Please check your column names.")
         return None
 
-    # Prepare features for prediction
-    X = df[features]
+    # Fail fast on non-numeric features instead of letting the model raise mid-inference
+    non_numeric_features = [f for f, dtype in df[features].dtypes.items() if not pd.api.types.is_numeric_dtype(dtype)]
+    if non_numeric_features:
+        st.error(f"Error: Required features must be numeric: {', '.join(non_numeric_features)}. Please check your column values.")
+        return None
+
+    # Prepare features for prediction (contiguous float32, the dtype the forest uses internally)
+    X = np.ascontiguousarray(df[features].to_numpy(dtype=np.float32))
     
     # 1. Predict Risk and Confidence (Probability)
-    df['Predicted_Risk'] = model.predict(X) 
+    # A single predict_proba pass; the class is its argmax, exactly as model.predict derives it
+    probabilities = predict_proba_chunked(model, X)
+    pred = model.classes_.take(np.argmax(probabilities, axis=1)).astype(np.int8)
     
-    # Get probability of being High Risk (Class 1)
-    probabilities = model.predict_proba(X)
-    df['Risk_Confidence'] = [p[1] for p in probabilities] # Probability of HIGH RISK (1)
-    
-    # 2. Define Risk Level based on predicted class
-    df['Risk_Level'] = df['Predicted_Risk'].apply(
-        lambda x: 'HIGH RISK (Action Needed)' if x == 1 else 'Low Compliance Risk'
-    )
-    
-    # 3. Calculate Estimated Cost
-    df['Estimated_Repair_Cost'] = df['Predicted_Risk'].apply(
-        lambda x: COST_HIGH_RISK_REPAIR if x == 1 else COST_LOW_RISK_REPAIR
-    )
+    # All output columns are built first and inserted with a single assign
+    new_cols = {
+        'Predicted_Risk': pred,
+        # Get probability of being High Risk (Class 1)
+        'Risk_Confidence': probabilities[:, 1].astype(np.float32, copy=False),
+        # 2. Define Risk Level based on predicted class
+        # Stored as a categorical: class codes index the labels directly, no string materialization
+        'Risk_Level': pd.Categorical.from_codes(pred, categories=RISK_LEVEL_CATEGORIES),
+        # 3. Calculate Estimated Cost
+        'Estimated_Repair_Cost': np.where(
+            pred == 1, COST_HIGH_RISK_REPAIR, COST_LOW_RISK_REPAIR
+        ).astype(np.int32),
+    }
+    # Parse dates once on upload so the cached aggregation doesn't re-parse them
+    if 'record_date' in df.columns:
+        new_cols['record_date'] = parse_record_dates(df['record_date'])
+    df = df.assign(**new_cols)
     
     return df
 
+@st.cache_data
+def analyze_uploaded_csv(csv_bytes, model_id):
+    """
+    Cached analysis keyed on the uploaded file contents and model version.
+    The model itself is not hashed; it comes from the cached resource.
+    """
+    model_assets = load_model_assets()
+    df_uploaded = read_uploaded_csv(io.BytesIO(csv_bytes), model_assets['features'])
+    # No defensive copy: analyze_data returns a new frame via assign and never mutates its input
+    return analyze_data(df_uploaded, model_assets)
+
+def model_version_id():
+    """Identifies the model file on disk so retraining invalidates cached analyses."""
+    return f"{MODEL_PATH}:{os.path.getmtime(MODEL_PATH)}"
+
 # --- 3. DATA AGGREGATION AND PLOTTING FUNCTIONS ---
 
+def numba_monthly_agg(grouped):
+    """Computes the per-month metrics with numba; returns None when numba isn't installed or can't compile."""
+    try:
+        from numba.core.errors import NumbaError, NumbaTypeSafetyWarning
+    except ImportError:
+        return None
+
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', NumbaTypeSafetyWarning)
+            means = grouped[['Risk_Confidence', 'weekly_score']].mean(
+                engine='numba', engine_kwargs=NUMBA_ENGINE_KWARGS
+            )
+            costs = grouped['Estimated_Repair_Cost'].sum(
+                engine='numba', engine_kwargs=NUMBA_ENGINE_KWARGS
+            )
+    except NumbaError:
+        return None # e.g. typing/lowering failure on an unsupported dtype
+    return pd.DataFrame({
+        'Avg_Failure_Prob': means['Risk_Confidence'],
+        'Total_Estimated_Cost': costs,
+        'Avg_Weekly_Score': means['weekly_score']
+    })
+
+@st.cache_resource
+def start_numba_warm_up():
+    """
+    Compiles the numba kernels on a background thread at startup, off the request path.
+    Returns the set of weekly_score dtypes compiled so far; it fills in as warm-up progresses.
+    """
+    warmed_dtypes = set()
+
+    def warm_up():
+        for dtype in NUMBA_WARM_DTYPES:
+            dummy = pd.DataFrame({
+                'YearMonth': pd.period_range('2000-01', periods=2, freq='M'),
+                'Risk_Confidence': np.zeros(2, dtype=np.float32),
+                'Estimated_Repair_Cost': np.zeros(2, dtype=np.int32),
+                'weekly_score': np.zeros(2, dtype=dtype)
+            })
+            if numba_monthly_agg(dummy.groupby('YearMonth', observed=True)) is None:
+                return # numba unavailable; the Cython path is used throughout
+            warmed_dtypes.add(dtype)
+
+    threading.Thread(target=warm_up, name='numba-warm-up', daemon=True).start()
+    return warmed_dtypes
+
+def monthly_groupby_agg(df, use_numba=False):
+    """Computes the per-month metrics, through numba when requested and available."""
+    grouped = df.groupby('YearMonth', observed=True)
+    if use_numba:
+        monthly = numba_monthly_agg(grouped)
+        if monthly is not None:
+            return monthly
+    return grouped.agg(
+        Avg_Failure_Prob=('Risk_Confidence', 'mean'),
+        Total_Estimated_Cost=('Estimated_Repair_Cost', 'sum'),
+        Avg_Weekly_Score=('weekly_score', 'mean')
+    )
+
+def monthly_polars_agg(df):
+    """Computes the per-month metrics with Polars; returns None when Polars isn't installed."""
+    try:
+        import polars as pl
+    except ImportError:
+        return None
+
+    pdf = pl.from_pandas(df[['record_date', 'Risk_Confidence', 'Estimated_Repair_Cost', 'weekly_score']])
+    monthly = pdf.group_by(pl.col('record_date').dt.truncate('1mo').alias('YearMonth')).agg([
+        pl.col('Risk_Confidence').mean().alias('Avg_Failure_Prob'),
+        # Polars sums Int32 as Int32 without overflow checks; widen before summing
+        pl.col('Estimated_Repair_Cost').cast(pl.Int64).sum().alias('Total_Estimated_Cost'),
+        pl.col('weekly_score').mean().alias('Avg_Weekly_Score'),
+    ]).sort('YearMonth').to_pandas()
+    monthly['YearMonth'] = monthly['YearMonth'].dt.to_period('M')
+    return monthly
+
 @st.cache_data
 def aggregate_monthly_data(df):
     """Aggregates prediction results by machine and month."""
     
-    # Ensure dates are valid
-    df['record_date'] = pd.to_datetime(df['record_date'], errors='coerce')
-    df.dropna(subset=['record_date'], inplace=True)
-    
-    # Create Year-Month column for grouping and charting
-    df['YearMonth'] = df['record_date'].dt.to_period('M').astype(str)
+    # Ensure dates are valid (works on a new frame so the caller's data isn't mutated)
+    df = df.assign(record_date=parse_record_dates(df['record_date']))
+    df = df.dropna(subset=['record_date'])
     
-    # Calculate Monthly Failure Probability (Avg Confidence of High Risk)
-    monthly_prob = df.groupby('YearMonth')['Risk_Confidence'].mean().reset_index()
-    monthly_prob.rename(columns={'Risk_Confidence': 'Avg_Failure_Prob'}, inplace=True)
-    monthly_prob['Avg_Failure_Prob'] = monthly_prob['Avg_Failure_Prob'] * 100 # Convert to percentage
+    # Single groupby pass for all three monthly metrics:
+    # - Monthly Failure Probability (Avg Confidence of High Risk)
+    # - Total Estimated Cost (Sum of all predicted repair costs)
+    # - Average Weekly Score (Compliance Metric)
+    monthly = monthly_polars_agg(df) if len(df) > POLARS_AGG_MIN_ROWS else None
 
-    # Calculate Total Estimated Cost (Sum of all predicted repair costs)
-    monthly_cost = df.groupby('YearMonth')['Estimated_Repair_Cost'].sum().reset_index()
-    monthly_cost.rename(columns={'Estimated_Repair_Cost': 'Total_Estimated_Cost'}, inplace=True)
+    if monthly is None:
+        # Create Year-Month column for grouping and charting
+        # Kept as PeriodDtype (int64-backed) so the groupby hashes integers; charts convert to str
+        df['YearMonth'] = df['record_date'].dt.to_period('M')
+        # numba only once its kernels are compiled for this dtype, so no upload pays the JIT cost
+        use_numba = len(df) >= NUMBA_AGG_MIN_ROWS and str(df['weekly_score'].dtype) in start_numba_warm_up()
+        monthly = monthly_groupby_agg(df, use_numba=use_numba).reset_index()
+    # Same dtypes whichever engine aggregated (Cython, numba and Polars differ otherwise)
+    monthly = monthly.astype({
+        'Avg_Failure_Prob': 'float64',
+        'Total_Estimated_Cost': 'int64',
+        'Avg_Weekly_Score': 'float64'
+    })
+    monthly['Avg_Failure_Prob'] *= 100 # Convert to percentage
 
-    # Calculate Average Weekly Score (Compliance Metric)
-    monthly_compliance = df.groupby('YearMonth')['weekly_score'].mean().reset_index()
-    monthly_compliance.rename(columns={'weekly_score': 'Avg_Weekly_Score'}, inplace=True)
+    monthly_prob = monthly[['YearMonth', 'Avg_Failure_Prob']]
+    monthly_cost = monthly[['YearMonth', 'Total_Estimated_Cost']]
+    monthly_compliance = monthly[['YearMonth', 'Avg_Weekly_Score']]
 
     return monthly_prob, monthly_cost, monthly_compliance
 
+def shrink_for_display(df):
+    """
+    Downcasts the remaining 64-bit numeric columns (the uploaded features) so less data
+    is serialized to the browser. Prediction columns are already narrow from analyze_data.
+    """
+    wide_cols = df.select_dtypes(include=['int64', 'float64']).columns
+    if wide_cols.empty:
+        return df
+    return df.assign(**{
+        c: pd.to_numeric(df[c], downcast='integer' if pd.api.types.is_integer_dtype(df[c]) else 'float')
+        for c in wide_cols
+    })
+
+@st.cache_data
+def export_bytes(df):
+    """Serializes the analyzed frame once per upload as (Parquet, CSV) bytes."""
+    buf_parquet = io.BytesIO()
+    df.to_parquet(buf_parquet, index=False, compression='zstd')
+    buf_csv = io.BytesIO()
+    df.to_csv(buf_csv, index=False)
+    return buf_parquet.getvalue(), buf_csv.getvalue()
+
 def create_monthly_probability_chart(df_prob):
     """Creates a professional monthly probability bar chart."""
-    fig = px.bar(
-        df_prob,
-        x='YearMonth',
-        y='Avg_Failure_Prob',
-        color='Avg_Failure_Prob',
-        color_continuous_scale=px.colors.sequential.Sunsetdark,
-        title='Monthly Failure Prediction Probability (Fleet Average)',
-        labels={'YearMonth': 'Month', 'Avg_Failure_Prob': 'Failure Probability (%)'},
-        template='plotly_dark'
-    )
+    months = df_prob['YearMonth'].astype(str).to_numpy()
+    probs = df_prob['Avg_Failure_Prob'].to_numpy()
+    ymax = probs.max() * 1.2 if len(probs) else 100
+
+    fig = go.Figure(go.Bar(
+        x=months,
+        y=probs,
+        marker=dict(
+            color=probs,
+            colorscale='Sunsetdark',
+            colorbar=dict(title='Failure Probability (%)')
+        ),
+        hovertemplate='Month=%{x}<br>Failure Probability (%)=%{y:.1f}<extra></extra>'
+    ))
     fig.update_layout(
+        title='Monthly Failure Prediction Probability (Fleet Average)',
         title_font_size=20,
         height=400,
-        yaxis_range=[0, df_prob['Avg_Failure_Prob'].max() * 1.2 if not df_prob.empty else 100]
+        template='plotly_dark',
+        xaxis_title='Month',
+        yaxis_title='Failure Probability (%)',
+        yaxis_range=[0, ymax]
     )
     st.plotly_chart(fig, use_container_width=True)
 
 def create_monthly_cost_chart(df_cost):
     """Creates a monthly estimated repair cost bar chart."""
-    fig = px.bar(
-        df_cost,
-        x='YearMonth',
-        y='Total_Estimated_Cost',
-        title='Total Estimated Repair Cost by Month (Fleet Budget)',
-        labels={'YearMonth': 'Month', 'Total_Estimated_Cost': 'Estimated Cost (USD)'},
-        color_discrete_sequence=['#4f46e5'],
-        template='plotly_dark'
-    )
+    fig = go.Figure(go.Bar(
+        x=df_cost['YearMonth'].astype(str).to_numpy(),
+        y=df_cost['Total_Estimated_Cost'].to_numpy(),
+        marker_color='#4f46e5',
+        hovertemplate='Month=%{x}<br>Estimated Cost (USD)=%{y:$,.0f}<extra></extra>'
+    ))
     fig.update_layout(
+        title='Total Estimated Repair Cost by Month (Fleet Budget)',
         title_font_size=20,
         height=400,
+        template='plotly_dark',
+        xaxis_title='Month',
+        yaxis_title='Estimated Cost (USD)',
         yaxis_tickprefix='$'
     )
     st.plotly_chart(fig, use_container_width=True)
 
 def create_adherence_chart(df_compliance):
     """Creates a chart for average weekly compliance score."""
-    fig = px.line(
-        df_compliance,
-        x='YearMonth',
-        y='Avg_Weekly_Score',
+    # WebGL trace: rendered on the browser's GPU instead of as SVG
+    fig = go.Figure(go.Scattergl(
+        x=df_compliance['YearMonth'].astype(str).to_numpy(),
+        y=df_compliance['Avg_Weekly_Score'].to_numpy(),
+        mode='lines+markers',
+        line=dict(color='#10b981'),
+        hovertemplate='Month=%{x}<br>Avg Weekly Score=%{y:.1f}<extra></extra>'
+    ))
+    fig.add_hline(y=RISK_THRESHOLD, line_dash="dash", line_color="red", annotation_text="High Risk Threshold", annotation_position="bottom right")
+    fig.update_layout(
         title='Average Weekly Compliance Score by Month',
-        labels={'YearMonth': 'Month', 'Avg_Weekly_Score': 'Avg Weekly Score'},
-        line_shape='spline',
-        markers=True,
-        color_discrete_sequence=['#10b981'],
-        template='plotly_dark'
+        title_font_size=20,
+        height=400,
+        template='plotly_dark',
+        xaxis_title='Month',
+        yaxis_title='Avg Weekly Score'
     )
-    fig.add_hline(y=RISK_THRESHOLD, line_dash="dash", line_color="red", annotation_text="High Risk Threshold", annotation_position="bottom right")
-    fig.update_layout(title_font_size=20, height=400)
     st.plotly_chart(fig, use_container_width=True)
 
 # --- 4. MAIN STREAMLIT APPLICATION LAYOUT ---
@@ -183,25 +389,23 @@ def main():
     # --- Main Dashboard ---
     st.title("⚙️ Proactive Maintenance Insight")
 
-    # Load assets first
-    model_assets = load_model_assets()
+    # Load assets first (stops the app early if the model is missing)
+    load_model_assets()
+    start_numba_warm_up()
 
     if uploaded_file is not None:
         try:
-            # Read and analyze data
-            df_uploaded = pd.read_csv(uploaded_file)
-            
-            df_analyzed = analyze_data(df_uploaded.copy(), model_assets)
+            # Read and analyze data (cached on file contents, so widget reruns skip prediction)
+            df_analyzed = analyze_uploaded_csv(uploaded_file.getvalue(), model_version_id())
             
             if df_analyzed is None:
                 return
             
-            # --- Aggregation for Charts ---
-            df_prob, df_cost, df_compliance = aggregate_monthly_data(df_analyzed)
-
             # --- Calculate Top-Level Metrics ---
-            total_machines = df_analyzed['unit_id'].nunique()
-            high_risk_count = df_analyzed[df_analyzed['Predicted_Risk'] == 1]['unit_id'].nunique()
+            # One pass over unit_id: a unit is high risk if any of its records is
+            unit_risk = df_analyzed.groupby('unit_id', sort=False)['Predicted_Risk'].max()
+            total_machines = len(unit_risk)
+            high_risk_count = int(unit_risk.sum())
             avg_compliance = df_analyzed['weekly_score'].mean()
             total_cost = df_analyzed['Estimated_Repair_Cost'].sum()
             
@@ -241,31 +445,59 @@ def main():
                     """, unsafe_allow_html=True)
 
             st.markdown("---")
-            st.header("2. Monthly Analysis & Fleet Trends")
-            
-            # --- 2. Monthly Probability Bar Chart (Matching Reference Image Style) ---
-            st.subheader("Monthly Failure Prediction Probability (Fleet Trend)")
-            create_monthly_probability_chart(df_prob)
+            st.header("2. Monthly Analysis & Analyzed Data")
 
-            # --- 3. Compliance and Cost Analysis ---
-            colA, colB = st.columns(2)
-            
-            with colA:
-                 st.subheader("Monthly Estimated Repair Cost (Fleet Trend)")
-                 create_monthly_cost_chart(df_cost)
+            # Only the selected view runs each rerun, so charts (and the monthly
+            # aggregation) are computed lazily; st.tabs would execute every tab body.
+            view = st.radio(
+                "View",
+                ["Probability", "Cost", "Compliance", "Table"],
+                horizontal=True,
+                label_visibility="collapsed"
+            )
+
+            if view == "Probability":
+                # --- Probability View: Monthly Bar Chart (Matching Reference Image Style) ---
+                st.subheader("Monthly Failure Prediction Probability (Fleet Trend)")
+                df_prob, _, _ = aggregate_monthly_data(df_analyzed)
+                create_monthly_probability_chart(df_prob)
+
+            elif view == "Cost":
+                # --- Cost View ---
+                st.subheader("Monthly Estimated Repair Cost (Fleet Trend)")
+                _, df_cost, _ = aggregate_monthly_data(df_analyzed)
+                create_monthly_cost_chart(df_cost)
 
-            with colB:
+            elif view == "Compliance":
+                # --- Compliance View ---
                 st.subheader("Compliance Adherence Trend")
+                _, _, df_compliance = aggregate_monthly_data(df_analyzed)
                 create_adherence_chart(df_compliance)
-                
-            st.markdown("---")
-            st.header("3. Analyzed Data Table")
-            st.dataframe(df_analyzed, use_container_width=True)
+
+            else:
+                # --- Table View ---
+                st.subheader("Analyzed Data Table")
+                # Paginated so only one slice of a large upload is sent per rerun
+                page_count = max(1, -(-len(df_analyzed) // TABLE_PAGE_ROWS))
+                page = st.number_input("Page", min_value=1, max_value=page_count, value=1, step=1) if page_count > 1 else 1
+                page_start = (page - 1) * TABLE_PAGE_ROWS
+                df_page = df_analyzed.iloc[page_start:page_start + TABLE_PAGE_ROWS]
+                st.dataframe(shrink_for_display(df_page), use_container_width=True)
+                st.caption(f"Showing rows {page_start + 1:,}-{page_start + len(df_page):,} of {len(df_analyzed):,}")
 
             # --- Save for Future Learning ---
             st.markdown("---")
             st.subheader("Future Learning")
-            csv_export = df_analyzed.to_csv(index=False).encode('utf-8')
+            parquet_export, csv_export = export_bytes(df_analyzed)
+            export_name = os.path.splitext(uploaded_file.name)[0]
+            st.download_button(
+                label="Save Predictions for Future Learning (Parquet)",
+                data=parquet_export,
+                file_name=f'predictions_{export_name}.parquet',
+                mime='application/vnd.apache.parquet',
+                help="Compact, fast-to-load format recommended for large datasets and retraining a new model later.",
+                type='primary'
+            )
             st.download_button(
                 label="Save Predictions for Future Learning (CSV)",
                 data=csv_export,
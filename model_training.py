@@ -39,7 +39,7 @@ def train_and_save_model():
     # NOTE: With only 5 data points, training a model is primarily for structure demonstration.
     X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.4, random_state=42)
     
-    model = RandomForestClassifier(n_estimators=10, random_state=42)
+    model = RandomForestClassifier(n_estimators=10, random_state=42, n_jobs=-1)
     model.fit(X, y) # Training on full small set for stability
 
     # --- 4. Save the Model and Feature List ---